@@ -7,10 +7,31 @@ Provides headless operation for automated testing
 import argparse
 import sys
 import json
-import cv2
 import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from .main import CameraHardwareTester, TestResult
+
+# Faster JSON encoder for result files, if installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def probe_camera(index):
+    """Open camera index and return (index, width, height), or None if unusable"""
+    import cv2
+
+    cap = cv2.VideoCapture(index)
+    try:
+        if cap.isOpened():
+            ret, frame = cap.read()
+            if ret:
+                height, width = frame.shape[:2]
+                return index, width, height
+    finally:
+        cap.release()
+    return None
 
 class CLITester:
     def __init__(self):
@@ -19,6 +40,11 @@ class CLITester:
 
     def run_headless_tests(self, camera_index=0, output_file=None, tests=None):
         """Run tests without GUI"""
+        # OpenCV and the tester are only imported when tests actually run,
+        # keeping --help, --version and --gui free of their import cost
+        import cv2
+        from .main import CameraHardwareTester
+
         print(f"USB Camera Test Suite v1.0.0 - CLI Mode")
         print(f"Testing camera at index {camera_index}")
         print("-" * 50)
@@ -52,16 +78,19 @@ class CLITester:
         gui_tester.camera = self.camera
 
         # Run tests
-        for i, test_name in enumerate(test_list):
-            print(f"[{i+1}/{len(test_list)}] {test_name}...", end=" ")
+        run_single_test = gui_tester._run_single_test
+        add_result = self.results.append
+        status_symbols = {"PASS": "✓", "FAIL": "✗"}
+        total = len(test_list)
+
+        for i, test_name in enumerate(test_list, 1):
+            print(f"[{i}/{total}] {test_name}...", end=" ")
 
-            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            result = gui_tester._run_single_test(test_name)
-            self.results.append(result)
+            result = run_single_test(test_name)
+            add_result(result)
 
             # Print result
-            status_symbol = "✓" if result.status == "PASS" else "✗" if result.status == "FAIL" else "⚠"
-            print(f"{status_symbol} {result.status}")
+            print(f"{status_symbols.get(result.status, '⚠')} {result.status}")
             if result.message:
                 print(f"    {result.message}")
 
@@ -84,9 +113,10 @@ class CLITester:
         print("TEST SUMMARY")
         print("=" * 50)
 
-        pass_count = sum(1 for r in self.results if r.status == "PASS")
-        fail_count = sum(1 for r in self.results if r.status == "FAIL")
-        skip_count = sum(1 for r in self.results if r.status == "SKIP")
+        counts = Counter(r.status for r in self.results)
+        pass_count = counts["PASS"]
+        fail_count = counts["FAIL"]
+        skip_count = counts["SKIP"]
 
         print(f"Total Tests: {len(self.results)}")
         print(f"Passed:      {pass_count}")
@@ -105,30 +135,36 @@ class CLITester:
     def save_results(self, filename):
         """Save results to file"""
         try:
+            counts = Counter(r.status for r in self.results)
             report_data = {
                 "timestamp": datetime.now().isoformat(),
                 "camera_model": "WN-L2307k368 48MP BM",
                 "test_mode": "CLI",
                 "summary": {
                     "total": len(self.results),
-                    "passed": sum(1 for r in self.results if r.status == "PASS"),
-                    "failed": sum(1 for r in self.results if r.status == "FAIL"),
-                    "skipped": sum(1 for r in self.results if r.status == "SKIP")
+                    "passed": counts["PASS"],
+                    "failed": counts["FAIL"],
+                    "skipped": counts["SKIP"]
                 },
-                "results": []
+                "results": [
+                    {
+                        "test_name": result.test_name,
+                        "status": result.status,
+                        "message": result.message,
+                        "timestamp": result.timestamp,
+                        "details": result.details
+                    }
+                    for result in self.results
+                ]
             }
 
-            for result in self.results:
-                report_data["results"].append({
-                    "test_name": result.test_name,
-                    "status": result.status,
-                    "message": result.message,
-                    "timestamp": result.timestamp,
-                    "details": result.details
-                })
-
-            with open(filename, 'w') as f:
-                json.dump(report_data, f, indent=2)
+            if orjson:
+                options = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+                with open(filename, 'wb') as f:
+                    f.write(orjson.dumps(report_data, option=options))
+            else:
+                with open(filename, 'w') as f:
+                    json.dump(report_data, f, indent=2)
 
             print(f"\n✓ Results saved to {filename}")
 
@@ -178,16 +214,11 @@ Examples:
     if args.list_cameras:
         # List available cameras
         print("Scanning for cameras...")
-        found_cameras = []
-
-        for i in range(10):
-            cap = cv2.VideoCapture(i)
-            if cap.isOpened():
-                ret, frame = cap.read()
-                if ret:
-                    height, width = frame.shape[:2]
-                    found_cameras.append((i, width, height))
-                cap.release()
+
+        # Probe all indices at once; OpenCV releases the GIL while opening,
+        # so the scan takes as long as the slowest probe rather than the sum
+        with ThreadPoolExecutor(max_workers=10) as executor:
+            found_cameras = [cam for cam in executor.map(probe_camera, range(10)) if cam]
 
         if found_cameras:
             print("Available cameras:")
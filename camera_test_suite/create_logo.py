@@ -3,51 +3,84 @@
 Create a professional logo for USB Camera Tester app
 """
 from PIL import Image, ImageDraw, ImageFont
+import numpy as np
+import argparse
+import hashlib
+import inspect
 import os
+import shutil
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+
+FONT_PATH = "/System/Library/Fonts/Arial.ttf"
+
+# Rendered master logos are cached outside the source tree so they never
+# ship in the app bundle
+CACHE_DIR = Path.home() / ".cache" / "usb_camera_tester" / "logo"
+
+@lru_cache(maxsize=8)
+def _get_font_and_bbox(path, size, text):
+    """Load a TrueType font once (falling back to PIL's default font) and
+    return it with the bounding box of text laid out in it"""
+    try:
+        font = ImageFont.truetype(path, size)
+    except OSError:
+        font = ImageFont.load_default()
+    return font, font.getbbox(text)
 
-def create_app_logo():
+def create_app_logo(size=1024):
     """Create a professional logo for the USB Camera Tester app"""
 
-    # Create a 512x512 icon (macOS app icon size)
-    size = 512
-    img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
-    draw = ImageDraw.Draw(img)
+    # Render at the largest macOS icon size (1024x1024) so every smaller
+    # icon is a downsample; the layout below is in 512px design units
+    scale = size // 512
 
     # Background gradient effect - dark blue to light blue
-    for y in range(size):
-        alpha = int(255 * (1 - y / size * 0.3))
-        color = (30 + int(50 * y / size), 60 + int(100 * y / size), 120 + int(120 * y / size), alpha)
-        draw.rectangle([(0, y), (size, y+1)], fill=color)
+    # Compute one colour per row, then broadcast it across the width
+    y = np.arange(size)
+    gradient = np.empty((size, 3), dtype=np.uint8)
+    gradient[:, 0] = 30 + (50 * y / size).astype(int)
+    gradient[:, 1] = 60 + (100 * y / size).astype(int)
+    gradient[:, 2] = 120 + (120 * y / size).astype(int)
+    rgb = np.broadcast_to(gradient[:, np.newaxis, :], (size, size, 3))
 
     # Add rounded corners
-    corner_radius = 80
-    mask = Image.new('L', (size, size), 0)
-    mask_draw = ImageDraw.Draw(mask)
-    mask_draw.rounded_rectangle([(0, 0), (size, size)], corner_radius, fill=255)
-
-    # Apply mask for rounded corners
-    img.putalpha(mask)
+    # Distance from each pixel centre to the nearest point of the inner
+    # rectangle; pixels within corner_radius of it are inside the shape
+    corner_radius = 80 * scale
+    yy, xx = np.ogrid[:size, :size]
+    dx = (xx + 0.5) - np.clip(xx + 0.5, corner_radius, size - corner_radius)
+    dy = (yy + 0.5) - np.clip(yy + 0.5, corner_radius, size - corner_radius)
+    mask = (dx * dx + dy * dy) <= corner_radius * corner_radius
+
+    # Assemble RGB and the corner mask as alpha in a single pass
+    rgba = np.dstack([rgb, mask.astype(np.uint8) * 255])
+    img = Image.fromarray(rgba, 'RGBA')
+    draw = ImageDraw.Draw(img)
 
     # Draw camera icon elements
     # Main camera body
     camera_size = size // 3
     camera_x = (size - camera_size) // 2
-    camera_y = (size - camera_size) // 2 - 30
+    camera_y = (size - camera_size) // 2 - 30 * scale
 
     # Camera body (rounded rectangle)
     draw.rounded_rectangle(
-        [(camera_x, camera_y), (camera_x + camera_size, camera_y + camera_size - 40)],
-        20, fill=(240, 240, 240, 255), outline=(200, 200, 200, 255), width=3
+        [(camera_x, camera_y), (camera_x + camera_size, camera_y + camera_size - 40 * scale)],
+        20 * scale, fill=(240, 240, 240, 255), outline=(200, 200, 200, 255), width=3 * scale
     )
 
     # Camera lens (circle)
     lens_size = camera_size // 2
     lens_x = camera_x + (camera_size - lens_size) // 2
-    lens_y = camera_y + (camera_size - lens_size) // 2 - 20
+    lens_y = camera_y + (camera_size - lens_size) // 2 - 20 * scale
 
     # Outer lens ring
+    ring = 10 * scale
     draw.ellipse(
-        [(lens_x - 10, lens_y - 10), (lens_x + lens_size + 10, lens_y + lens_size + 10)],
+        [(lens_x - ring, lens_y - ring), (lens_x + lens_size + ring, lens_y + lens_size + ring)],
         fill=(60, 60, 60, 255)
     )
 
@@ -59,79 +92,159 @@ def create_app_logo():
 
     # Lens reflection
     reflection_size = lens_size // 3
+    inset = 15 * scale
     draw.ellipse(
-        [(lens_x + 15, lens_y + 15), (lens_x + 15 + reflection_size, lens_y + 15 + reflection_size)],
+        [(lens_x + inset, lens_y + inset), (lens_x + inset + reflection_size, lens_y + inset + reflection_size)],
         fill=(100, 150, 200, 180)
     )
 
     # USB connector
-    usb_width = 60
-    usb_height = 20
-    usb_x = camera_x + camera_size - usb_width - 10
-    usb_y = camera_y + camera_size - 30
+    usb_width = 60 * scale
+    usb_height = 20 * scale
+    usb_x = camera_x + camera_size - usb_width - 10 * scale
+    usb_y = camera_y + camera_size - 30 * scale
 
     draw.rounded_rectangle(
         [(usb_x, usb_y), (usb_x + usb_width, usb_y + usb_height)],
-        5, fill=(80, 80, 80, 255)
+        5 * scale, fill=(80, 80, 80, 255)
     )
 
     # USB symbol
-    draw.rectangle([(usb_x + 45, usb_y + 6), (usb_x + 50, usb_y + 14)], fill=(255, 255, 255, 255))
+    draw.rectangle([(usb_x + 45 * scale, usb_y + 6 * scale), (usb_x + 50 * scale, usb_y + 14 * scale)],
+                   fill=(255, 255, 255, 255))
 
     # Test indicators (small colored dots)
-    dot_size = 15
+    dot_size = 15 * scale
     colors = [(0, 255, 0, 255), (255, 165, 0, 255), (255, 0, 0, 255)]  # Green, Orange, Red
     for i, color in enumerate(colors):
-        dot_x = camera_x - 40 + i * 25
-        dot_y = camera_y + 20
+        dot_x = camera_x + (i * 25 - 40) * scale
+        dot_y = camera_y + 20 * scale
         draw.ellipse([(dot_x, dot_y), (dot_x + dot_size, dot_y + dot_size)], fill=color)
 
     # Add text "USB CAM TEST" at bottom
-    try:
-        # Try to use a system font
-        font_size = 32
-        font = ImageFont.truetype("/System/Library/Fonts/Arial.ttf", font_size)
-    except:
-        # Fallback to default font
-        font = ImageFont.load_default()
-
+    font_size = 32 * scale
     text = "USB CAM TEST"
-    bbox = draw.textbbox((0, 0), text, font=font)
+    font, bbox = _get_font_and_bbox(FONT_PATH, font_size, text)
     text_width = bbox[2] - bbox[0]
     text_x = (size - text_width) // 2
-    text_y = camera_y + camera_size + 20
+    text_y = camera_y + camera_size + 20 * scale
 
     # Text shadow
-    draw.text((text_x + 2, text_y + 2), text, fill=(0, 0, 0, 100), font=font)
+    draw.text((text_x + 2 * scale, text_y + 2 * scale), text, fill=(0, 0, 0, 100), font=font)
     # Main text
     draw.text((text_x, text_y), text, fill=(255, 255, 255, 255), font=font)
 
     return img
 
-def create_icon_sizes():
+def create_icon_sizes(icons_dir=None):
     """Create different icon sizes for macOS app bundle"""
-    base_logo = create_app_logo()
-
     # Standard macOS icon sizes
     sizes = [16, 32, 64, 128, 256, 512, 1024]
 
-    icons_dir = "/Users/aaronsimo/Kam/Kam/camera_test_suite/icons"
-    os.makedirs(icons_dir, exist_ok=True)
+    # Default to the icons folder next to this script
+    icons_dir = Path(icons_dir) if icons_dir else Path(__file__).resolve().parent / "icons"
+    icons_dir.mkdir(parents=True, exist_ok=True)
 
-    for size in sizes:
-        resized = base_logo.resize((size, size), Image.Resampling.LANCZOS)
-        resized.save(f"{icons_dir}/icon_{size}x{size}.png")
-        print(f"Created icon_{size}x{size}.png")
-
-    # Save the main icon
-    base_logo.save(f"{icons_dir}/app_icon.png")
+    # The logo is deterministic, so reuse the last rendering unless the
+    # drawing code or the font it was rendered with has changed
+    try:
+        font_stamp = f"{FONT_PATH}:{os.path.getmtime(FONT_PATH)}"
+    except OSError:
+        font_stamp = "default-font"
+    key_source = "".join([inspect.getsource(create_app_logo),
+                          inspect.getsource(_get_font_and_bbox),
+                          font_stamp])
+    cache_key = hashlib.sha256(key_source.encode()).hexdigest()[:16]
+    cache_path = CACHE_DIR / f"logo_{cache_key}.png"
+    if cache_path.exists():
+        base_logo = Image.open(cache_path)
+        base_logo.load()
+        print("Using cached logo")
+    else:
+        base_logo = create_app_logo()
+        try:
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            # Only the current rendering is worth keeping
+            for stale in CACHE_DIR.glob("logo_*.png"):
+                stale.unlink()
+            base_logo.save(cache_path, format='PNG', compress_level=1)
+        except OSError as e:
+            print(f"Could not cache logo: {e}")
+
+    # Walk the sizes as a mip chain: each smaller icon is resampled from the
+    # previous one (a 2x reduction) instead of from the full-size logo
+    icons = []
+    current = base_logo
+    for size in sorted(sizes, reverse=True):
+        if size == current.width:
+            resized = current
+        else:
+            # Plain box averaging is indistinguishable from LANCZOS at the
+            # tiny sizes and much cheaper
+            resample = Image.Resampling.LANCZOS if size >= 128 else Image.Resampling.BOX
+            resized = current.resize((size, size), resample)
+            if size < current.width:
+                current = resized
+        icons.append((size, resized))
+
+    # With oxipng available, write every PNG at the fastest deflate level
+    # and let it do a single size-optimising pass at the end
+    oxipng = shutil.which("oxipng")
+
+    def save_icon(item):
+        size, icon = item
+        # Fast deflate: the near-flat gradient compresses well even at low
+        # levels, and the tiny icons are too small for size to matter
+        compress_level = 1 if oxipng or size <= 64 else 3
+        if size <= 64:
+            # Tiny icons fit in a 256-colour palette: 1 byte per pixel to encode
+            icon = icon.quantize(colors=256, method=Image.Quantize.FASTOCTREE)
+        icon.save(icons_dir / f"icon_{size}x{size}.png", format='PNG',
+                  compress_level=compress_level, optimize=False)
+        return size
+
+    # Encoding is independent per icon and Pillow releases the GIL while
+    # compressing, so write the files concurrently
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        for size in executor.map(save_icon, icons):
+            print(f"Created icon_{size}x{size}.png")
+
+    # Save the main icon (512x512, as shipped to the Linux installers)
+    dict(icons)[512].save(icons_dir / "app_icon.png", format='PNG',
+                          compress_level=1 if oxipng else 3, optimize=False)
     print("Created app_icon.png")
 
-    # Create .icns file for macOS (using the 512x512 as base)
-    base_logo.save(f"{icons_dir}/app_icon.icns")
+    if oxipng:
+        png_files = [icons_dir / f"icon_{size}x{size}.png" for size in sizes]
+        png_files.append(icons_dir / "app_icon.png")
+        result = subprocess.run([oxipng, "-o", "2", "--strip", "safe", "-q", *png_files])
+        if result.returncode == 0:
+            print("Optimized PNGs with oxipng")
+
+    # Create .icns file for macOS
+    # iconutil assembles a real multi-resolution container from the PNGs
+    # written above; elsewhere let Pillow's ICNS writer build it
+    icns_path = icons_dir / "app_icon.icns"
+    if shutil.which("iconutil"):
+        iconset_dir = icons_dir / "AppIcon.iconset"
+        iconset_dir.mkdir(exist_ok=True)
+        for size in (16, 32, 128, 256, 512):
+            shutil.copyfile(icons_dir / f"icon_{size}x{size}.png",
+                            iconset_dir / f"icon_{size}x{size}.png")
+            shutil.copyfile(icons_dir / f"icon_{size * 2}x{size * 2}.png",
+                            iconset_dir / f"icon_{size}x{size}@2x.png")
+        subprocess.run(["iconutil", "-c", "icns", "-o", icns_path, iconset_dir], check=True)
+        shutil.rmtree(iconset_dir, ignore_errors=True)
+    else:
+        base_logo.save(icns_path, format='ICNS')
     print("Created app_icon.icns")
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Create the USB Camera Tester app icons")
+    parser.add_argument("--icons-dir", type=str,
+                        help="Output directory (default: icons/ next to this script)")
+    args = parser.parse_args()
+
     print("Creating USB Camera Tester app logo...")
-    create_icon_sizes()
+    create_icon_sizes(args.icons_dir)
     print("Logo creation complete!")
\ No newline at end of file
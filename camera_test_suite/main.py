@@ -15,7 +15,7 @@ if os.environ.get('DISPLAY') == '' and not os.environ.get('FORCE_GUI'):
     sys.exit(1)
 
 import tkinter as tk
-from tkinter import ttk, messagebox, filedialog
+from tkinter import ttk
 from datetime import datetime
 import cv2
 import numpy as np
@@ -25,38 +25,51 @@ import time
 import json
 import subprocess
 import hashlib
-from dataclasses import dataclass, asdict, field
-from typing import Dict, List, Optional, Tuple, Any
-from enum import Enum
-
-class TestStatus(Enum):
-    PASS = "PASS"
-    FAIL = "FAIL"
-    PARTIAL = "PARTIAL"
-    SKIP = "SKIP"
-    ERROR = "ERROR"
-
-@dataclass
-class DetailedTestResult:
-    test_name: str
-    status: TestStatus
-    message: str
-    timestamp: str
-    details: Dict[str, Any] = field(default_factory=dict)
-    measurements: Dict[str, float] = field(default_factory=dict)
-    raw_data: Optional[np.ndarray] = None
-
-    def to_dict(self):
-        return {
-            'test_name': self.test_name,
-            'status': self.status.value,
-            'message': self.message,
-            'timestamp': self.timestamp,
-            'details': self.details,
-            'measurements': self.measurements
-        }
+
+from results import TestStatus, DetailedTestResult
+
+# BGR luma weights (same as cv2.COLOR_BGR2GRAY)
+_BGR2Y = np.array([0.114, 0.587, 0.299], dtype=np.float32)
 
 class ModernCameraHardwareTester:
+    # Properties shown in the camera information panel (read-only snapshot)
+    INFO_PROPERTIES = (
+        ("Width", cv2.CAP_PROP_FRAME_WIDTH),
+        ("Height", cv2.CAP_PROP_FRAME_HEIGHT),
+        ("FPS", cv2.CAP_PROP_FPS),
+        ("Exposure", cv2.CAP_PROP_EXPOSURE),
+        ("Gain", cv2.CAP_PROP_GAIN),
+        ("Brightness", cv2.CAP_PROP_BRIGHTNESS),
+        ("Contrast", cv2.CAP_PROP_CONTRAST),
+        ("Saturation", cv2.CAP_PROP_SATURATION)
+    )
+
+    # Consecutive failed grabs before the preview gives up on the camera
+    MAX_GRAB_FAILURES = 50
+
+    # Last detection results, keyed by the OS device listing
+    DETECTION_CACHE = os.path.expanduser("~/.cache/usb_camera_tester/detection.json")
+
+    # Backends tried, in order, when probing a camera index
+    DETECTION_BACKENDS = (cv2.CAP_ANY, cv2.CAP_AVFOUNDATION)
+
+    # Preferred capture resolutions on connect, best first
+    CONNECT_RESOLUTIONS = (
+        (1920, 1080),  # 1080p - start with safe resolution
+        (1280, 720),   # 720p
+        (640, 480)     # VGA
+    )
+
+    # Modes checked by the resolution and frame rate tests
+    TEST_RESOLUTIONS = (
+        (8000, 6000, "48MP"),
+        (4000, 3000, "12MP"),
+        (1920, 1080, "1080p"),
+        (1280, 720, "720p"),
+        (640, 480, "VGA")
+    )
+    FRAMERATE_RESOLUTIONS = TEST_RESOLUTIONS[2:]
+
     def __init__(self):
         print("Initializing Professional Camera Test Suite...")
 
@@ -173,12 +186,19 @@ class ModernCameraHardwareTester:
             "measure_latency": True,
             "thermal_monitoring": True,
             "extended_af_test": True,
-            "color_chart_test": False
+            "color_chart_test": False,
+            "prefer_mjpeg": True  # Disable to keep the driver default (e.g. YUY2)
         }
 
         # Create professional UI
         self.create_professional_ui()
 
+        # Track whether the window is on screen so the preview can skip
+        # decoding and drawing frames while it is minimized
+        self.window_visible = True
+        self.root.bind("<Map>", self._on_window_map)
+        self.root.bind("<Unmap>", self._on_window_map)
+
         # Initialize status and info
         self.update_status("Ready for testing")
 
@@ -331,6 +351,9 @@ Camera permissions may be required."""
 
         self.create_button(btn_frame, "Auto-Detect Camera", self.start_camera_detection,
                           style='Modern.TButton').pack(fill="x", pady=2)
+        self.create_button(btn_frame, "Rescan Cameras",
+                          lambda: self.start_camera_detection(force_rescan=True),
+                          style='Modern.TButton').pack(fill="x", pady=2)
         self.create_button(btn_frame, "Manual Connect", self.manual_connect,
                           style='Modern.TButton').pack(fill="x", pady=2)
         self.create_button(btn_frame, "Disconnect", self.disconnect_camera,
@@ -488,6 +511,10 @@ Camera permissions may be required."""
                                        bg=self.colors['bg_dark'],
                                        highlightthickness=0)
         self.preview_canvas.pack(fill="both", expand=True, pady=(0, 10))
+        self.preview_image_id = None
+        self.preview_size = (0, 0)
+        self.preview_pending = False
+        self.preview_canvas.bind("<Configure>", self._on_preview_resize)
 
         # Preview controls
         control_frame = tk.Frame(preview_frame, bg=self.colors['bg_medium'])
@@ -565,6 +592,17 @@ Camera permissions may be required."""
         self.results_tree.column('Time', width=60)
         self.results_tree.column('Details', width=100)
 
+        # Colour code results by status; tags are configured once up front
+        status_colors = {
+            TestStatus.PASS: self.colors['accent_green'],
+            TestStatus.FAIL: self.colors['accent_red'],
+            TestStatus.PARTIAL: self.colors['accent_yellow'],
+            TestStatus.SKIP: self.colors['text_secondary'],
+            TestStatus.ERROR: self.colors['accent_purple']
+        }
+        for status, color in status_colors.items():
+            self.results_tree.tag_configure(status.value, foreground=color)
+
         self.results_tree.pack(fill="both", expand=True)
 
         # Scrollbar
@@ -610,10 +648,11 @@ Camera permissions may be required."""
         return btn
 
     # Camera control methods
-    def start_camera_detection(self):
+    def start_camera_detection(self, force_rescan=False):
         """Start camera detection in a thread"""
         self.update_status("Starting camera detection...")
-        threading.Thread(target=self.auto_detect_cameras, daemon=True).start()
+        threading.Thread(target=self.auto_detect_cameras, args=(force_rescan,),
+                         daemon=True).start()
 
     def simple_detect_cameras(self):
         """Simple fallback camera detection with crash protection"""
@@ -664,71 +703,178 @@ Camera permissions may be required."""
 
         return found_cameras
 
-    def auto_detect_cameras(self):
-        """Auto-detect available cameras with enhanced detection"""
-        self.update_status("Scanning for cameras...")
-        found_cameras = []
-        tested_indices = set()
+    def system_camera_listing(self):
+        """Camera indices reported by the OS plus a signature of that listing
+
+        Either value is None when the OS can't be queried.
+        """
+        try:
+            if platform.system() == "Darwin":
+                # Ask AVFoundation in-process when pyobjc is installed;
+                # system_profiler takes seconds to start
+                try:
+                    from AVFoundation import AVCaptureDevice, AVMediaTypeVideo
+                except ImportError:
+                    AVCaptureDevice = None
+
+                if AVCaptureDevice is not None:
+                    devices = AVCaptureDevice.devicesWithMediaType_(AVMediaTypeVideo)
+                    unique_ids = sorted(str(d.uniqueID()) for d in devices)
+                    signature = hashlib.sha1(" ".join(unique_ids).encode()).hexdigest()
+                    return (list(range(len(unique_ids))) or None), signature
+
+                result = subprocess.run(["system_profiler", "SPCameraDataType"],
+                                        capture_output=True, text=True, timeout=5)
+                count = result.stdout.count("Unique ID:")
+                signature = hashlib.sha1(result.stdout.encode()).hexdigest()
+                return (list(range(count)) if count else None), signature
+            if platform.system() == "Linux":
+                nodes = sorted(name for name in os.listdir("/dev") if name.startswith("video"))
+                indices = sorted(int(n[5:]) for n in nodes if n[5:].isdigit())
+                return (indices or None), self.linux_camera_signature(nodes)
+        except Exception as e:
+            print(f"System camera enumeration failed: {e}")
+        return None, None
+
+    def linux_camera_signature(self, nodes):
+        """Hash each video node's device name and USB vendor/product/serial
+
+        Swapping one camera for another on the same /dev/videoN changes the
+        signature even though the node names stay the same.
+        """
+        entries = []
+        for node in nodes:
+            sys_dir = f"/sys/class/video4linux/{node}"
+            fields = [node]
+            # device/.. is the USB device that owns the video interface
+            for attr in ("name", "device/../idVendor", "device/../idProduct", "device/../serial"):
+                try:
+                    with open(os.path.join(sys_dir, attr)) as f:
+                        fields.append(f.read().strip())
+                except OSError:
+                    fields.append("")
+            entries.append(":".join(fields))
+
+        try:
+            entries.extend(sorted(os.listdir("/dev/v4l/by-id")))
+        except OSError:
+            pass
+
+        return hashlib.sha1("\n".join(entries).encode()).hexdigest()
+
+    def load_detection_cache(self, signature):
+        """Cameras found by the last scan, if the OS still lists the same devices"""
+        if not signature:
+            return None
+        try:
+            with open(self.DETECTION_CACHE) as f:
+                cache = json.load(f)
+            if cache.get("signature") == signature:
+                return cache.get("cameras") or None
+        except (OSError, ValueError):
+            pass
+        return None
 
-        # Try different backends for better detection
-        backends = [cv2.CAP_ANY, cv2.CAP_AVFOUNDATION]  # Reduce to most reliable backends
+    def save_detection_cache(self, signature, cameras):
+        """Remember detected cameras for the given device listing"""
+        if not signature:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.DETECTION_CACHE), exist_ok=True)
+            with open(self.DETECTION_CACHE, 'w') as f:
+                json.dump({"signature": signature, "cameras": cameras}, f)
+        except OSError as e:
+            print(f"Could not save detection cache: {e}")
+
+    def clear_detection_cache(self):
+        """Forget cached detection results"""
+        try:
+            os.remove(self.DETECTION_CACHE)
+        except OSError:
+            pass
 
+    def probe_camera(self, index, backends):
+        """Open a camera index with the first working backend and describe it"""
         for backend in backends:
-            for i in range(10):  # Check reasonable range
-                if i in tested_indices:
-                    continue
+            cap = None
+            try:
+                print(f"Testing camera index {index} with backend {backend}")
+                cap = cv2.VideoCapture(index, backend)
+                if cap and cap.isOpened():
+                    # Set buffer size to prevent crashes
+                    cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+
+                    # grab() proves frames arrive without paying for a decode
+                    if cap.grab():
+                        width = cap.get(cv2.CAP_PROP_FRAME_WIDTH)
+                        height = cap.get(cv2.CAP_PROP_FRAME_HEIGHT)
+
+                        if width > 0 and height > 0:
+                            return {
+                                'index': index,
+                                'backend': backend,
+                                'resolution': f"{int(width)}x{int(height)}"
+                            }
 
-                try:
-                    print(f"Testing camera index {i} with backend {backend}")
-                    cap = None
+            except Exception as e:
+                print(f"Error with camera {index}: {e}")
 
+            finally:
+                if cap:
                     try:
-                        cap = cv2.VideoCapture(i, backend)
-                        if not cap:
-                            continue
-
-                        if cap.isOpened():
-                            # Set buffer size to prevent crashes
-                            cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
-
-                            # Test if we can actually read frames
-                            ret, frame = cap.read()
-                            if ret and frame is not None:
-                                width = cap.get(cv2.CAP_PROP_FRAME_WIDTH)
-                                height = cap.get(cv2.CAP_PROP_FRAME_HEIGHT)
-
-                                if width > 0 and height > 0:
-                                    camera_info = {
-                                        'index': i,
-                                        'backend': backend,
-                                        'resolution': f"{int(width)}x{int(height)}"
-                                    }
-
-                                    # Check for duplicates by index only
-                                    duplicate = False
-                                    for existing in found_cameras:
-                                        if existing['index'] == i:
-                                            duplicate = True
-                                            break
-
-                                    if not duplicate:
-                                        found_cameras.append(camera_info)
-                                        tested_indices.add(i)
-                                        print(f"Found camera: {camera_info}")
-
-                    except Exception as e:
-                        print(f"Error with camera {i}: {e}")
-
-                    finally:
-                        if cap:
-                            try:
-                                cap.release()
-                            except:
-                                pass
+                        cap.release()
+                    except:
+                        pass
 
-                except Exception as e:
-                    print(f"Error testing camera {i}: {e}")
-                    continue
+        return None
+
+    def probe_cameras(self, indices):
+        """Probe camera indices concurrently and return the working ones"""
+        found_cameras = []
+        results = {}
+
+        def probe(index):
+            results[index] = self.probe_camera(index, self.DETECTION_BACKENDS)
+
+        # Probe on daemon threads with a deadline so a hung VideoCapture open can't block exit
+        threads = [threading.Thread(target=probe, args=(i,), daemon=True) for i in indices]
+        for thread in threads:
+            thread.start()
+
+        deadline = time.monotonic() + 10
+        for thread in threads:
+            thread.join(max(0, deadline - time.monotonic()))
+
+        for index in indices:
+            if index not in results:
+                print(f"Camera probe for index {index} timed out")
+                continue
+            camera_info = results[index]
+            if camera_info:
+                found_cameras.append(camera_info)
+                print(f"Found camera: {camera_info}")
+
+        return found_cameras
+
+    def auto_detect_cameras(self, force_rescan=False):
+        """Auto-detect available cameras with enhanced detection"""
+        self.update_status("Scanning for cameras...")
+        indices, signature = self.system_camera_listing()
+
+        # Skip probing entirely while the OS reports the same devices as
+        # the last successful scan, unless a full rescan was requested
+        if force_rescan:
+            self.clear_detection_cache()
+            found_cameras = None
+        else:
+            found_cameras = self.load_detection_cache(signature)
+        if found_cameras:
+            print(f"Using cached detection: {found_cameras}")
+        else:
+            # Only probe indices the OS knows about, falling back to a fixed range
+            found_cameras = self.probe_cameras(indices or range(10))
+            if found_cameras:
+                self.save_detection_cache(signature, found_cameras)
 
         print(f"Total cameras found: {len(found_cameras)}")
 
@@ -765,9 +911,10 @@ Camera permissions may be required."""
                     info_text += f"  Backend: {cam.get('backend', 'Default')}\n\n"
 
                 # Use root.after to update UI from main thread
-                self.root.after(0, lambda: self.info_text.delete(1.0, tk.END))
-                self.root.after(0, lambda: self.info_text.insert(1.0, info_text))
+                self.root.after(0, lambda: self.set_info_text(info_text))
             else:
+                # The cached result may be stale; rescan on the next attempt
+                self.clear_detection_cache()
                 self.root.after(0, lambda: self.update_status("Failed to connect to detected camera", error=True))
         else:
             self.root.after(0, lambda: self.update_status("No cameras found - check connections and permissions", error=True))
@@ -784,8 +931,7 @@ Debug: Run from Terminal to see detailed output:
 cd "/Applications/USB Camera Tester.app/Contents/Resources/camera_test_suite"
 python3 main_enhanced.py"""
 
-            self.root.after(0, lambda: self.info_text.delete(1.0, tk.END))
-            self.root.after(0, lambda: self.info_text.insert(1.0, help_msg))
+            self.root.after(0, lambda: self.set_info_text(help_msg))
 
     def manual_connect(self):
         """Manual camera connection"""
@@ -828,14 +974,13 @@ python3 main_enhanced.py"""
                         self.update_status(f"Camera {index} opened but cannot read frames", error=True)
                         return False
 
-                    # Set to highest available resolution with error handling
-                    resolutions = [
-                        (1920, 1080),  # 1080p - start with safe resolution
-                        (1280, 720),   # 720p
-                        (640, 480)     # VGA
-                    ]
+                    # Request MJPEG before the resolution: uncompressed YUY2 at
+                    # high resolutions saturates USB 2.0 well below rated FPS
+                    if self.test_configs["prefer_mjpeg"]:
+                        self.set_mjpeg(self.camera)
 
-                    for width, height in resolutions:
+                    # Set to highest available resolution with error handling
+                    for width, height in self.CONNECT_RESOLUTIONS:
                         try:
                             self.camera.set(cv2.CAP_PROP_FRAME_WIDTH, width)
                             self.camera.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
@@ -849,9 +994,8 @@ python3 main_enhanced.py"""
 
                     self.camera_index = index
                     self.camera_backend = backend
-                    self.status_indicator.config(fg=self.colors['accent_green'])
-                    self.status_text.config(text=f"Camera {index} Connected")
-                    self.update_camera_info()
+                    # Widgets may only be touched from the Tk main loop
+                    self.root.after(0, lambda: self._show_camera_connected(index))
                     self.update_status(f"Successfully connected to camera {index}")
                     return True
                 else:
@@ -876,6 +1020,20 @@ python3 main_enhanced.py"""
 
         return False
 
+    def set_mjpeg(self, camera):
+        """Ask the camera for MJPEG frames; returns True if it accepted"""
+        mjpg = cv2.VideoWriter_fourcc(*'MJPG')
+        camera.set(cv2.CAP_PROP_FOURCC, mjpg)
+        accepted = int(camera.get(cv2.CAP_PROP_FOURCC)) == mjpg
+        print(f"MJPEG capture format {'enabled' if accepted else 'not supported'}")
+        return accepted
+
+    def _show_camera_connected(self, index):
+        """Reflect a successful connection in the UI"""
+        self.status_indicator.config(fg=self.colors['accent_green'])
+        self.status_text.config(text=f"Camera {index} Connected")
+        self.update_camera_info()
+
     def disconnect_camera(self):
         """Disconnect camera"""
         if self.preview_running:
@@ -902,24 +1060,18 @@ python3 main_enhanced.py"""
         info.append(f"Backend: {self.camera.getBackendName()}")
 
         # Get camera properties
-        props = {
-            "Width": cv2.CAP_PROP_FRAME_WIDTH,
-            "Height": cv2.CAP_PROP_FRAME_HEIGHT,
-            "FPS": cv2.CAP_PROP_FPS,
-            "Exposure": cv2.CAP_PROP_EXPOSURE,
-            "Gain": cv2.CAP_PROP_GAIN,
-            "Brightness": cv2.CAP_PROP_BRIGHTNESS,
-            "Contrast": cv2.CAP_PROP_CONTRAST,
-            "Saturation": cv2.CAP_PROP_SATURATION
-        }
-
-        for name, prop in props.items():
-            value = self.camera.get(prop)
+        get = self.camera.get
+        for name, prop in self.INFO_PROPERTIES:
+            value = get(prop)
             if value != -1:
                 info.append(f"{name}: {value:.2f}")
 
+        self.set_info_text("\n".join(info))
+
+    def set_info_text(self, text):
+        """Replace the camera information text in a single UI update"""
         self.info_text.delete(1.0, tk.END)
-        self.info_text.insert(1.0, "\n".join(info))
+        self.info_text.insert(1.0, text)
 
     # Preview methods
     def toggle_preview(self):
@@ -942,13 +1094,24 @@ python3 main_enhanced.py"""
         """Camera preview loop"""
         fps_counter = []
         last_time = time.time()
+        last_display = 0
+        display_interval = 1 / 30  # UI refresh rate
+        failures = 0
 
         while self.preview_running and self.camera:
-            ret, frame = self.camera.read()
-            if not ret:
+            # grab() keeps pace with the camera; only frames that will be
+            # shown are decoded with retrieve()
+            if not self.camera.grab():
+                # Back off instead of spinning on a stalled or unplugged camera
+                failures += 1
+                if failures >= self.MAX_GRAB_FAILURES:
+                    self.preview_running = False
+                    self.root.after(0, lambda: self.preview_btn.configure(text="Start Preview"))
+                    self.update_status("Camera stopped delivering frames", error=True)
+                    break
+                time.sleep(0.05)
                 continue
-
-            self.current_frame = frame
+            failures = 0
 
             # Calculate FPS
             current_time = time.time()
@@ -959,20 +1122,46 @@ python3 main_enhanced.py"""
             avg_fps = sum(fps_counter) / len(fps_counter) if fps_counter else 0
             last_time = current_time
 
+            if current_time - last_display < display_interval or not self.window_visible:
+                continue
+
+            ret, frame = self.camera.retrieve()
+            if not ret:
+                continue
+
+            self.current_frame = frame
+            last_display = current_time
+
             # Update display
             self.display_frame(frame)
             self.root.after(0, lambda: self.fps_label.config(text=f"FPS: {avg_fps:.1f}"))
 
-            time.sleep(0.01)
+    def _on_window_map(self, event):
+        """Record whether the main window is mapped (not minimized)"""
+        if event.widget is self.root:
+            self.window_visible = event.type == tk.EventType.Map
+
+    def read_fresh_frame(self, flush=0):
+        """Grab the next frame and decode it, first dropping `flush` frames
+
+        Only flush after a property change, so frames captured with the
+        old setting are discarded; the driver buffer is already one frame.
+        """
+        for _ in range(flush):
+            self.camera.grab()
+        return self.camera.retrieve() if self.camera.grab() else (False, None)
 
     def display_frame(self, frame):
-        """Display frame in preview canvas"""
+        """Display frame in preview canvas (called from the preview thread)"""
         if frame is None:
             return
 
-        # Resize frame to fit canvas
-        canvas_width = self.preview_canvas.winfo_width()
-        canvas_height = self.preview_canvas.winfo_height()
+        # Drop this frame if the main loop hasn't drawn the previous one yet
+        if self.preview_pending:
+            return
+
+        # Resize frame to fit canvas, using the size tracked on the main loop
+        canvas_width, canvas_height = self.preview_size
 
         if canvas_width > 1 and canvas_height > 1:
             h, w = frame.shape[:2]
@@ -988,16 +1177,33 @@ python3 main_enhanced.py"""
 
                 frame = cv2.resize(frame, (new_width, new_height))
 
-            # Convert to RGB and create PhotoImage
+            # Convert to RGB
             frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
             image = Image.fromarray(frame_rgb)
-            photo = ImageTk.PhotoImage(image=image)
 
-            # Update canvas
-            self.preview_canvas.delete("all")
-            self.preview_canvas.create_image(canvas_width//2, canvas_height//2,
-                                            image=photo, anchor="center")
-            self.preview_canvas.image = photo
+            # PhotoImage and the canvas are Tk objects, so hand over to the main loop
+            self.preview_pending = True
+            self.root.after(0, lambda: self._show_preview_image(image))
+
+    def _show_preview_image(self, image):
+        """Draw a prepared preview image on the canvas"""
+        self.preview_pending = False
+        photo = ImageTk.PhotoImage(image=image)
+
+        # Update canvas, reusing the same image item for every frame
+        canvas_width, canvas_height = self.preview_size
+        x, y = canvas_width // 2, canvas_height // 2
+        if self.preview_image_id is None:
+            self.preview_image_id = self.preview_canvas.create_image(x, y, image=photo,
+                                                                     anchor="center")
+        else:
+            self.preview_canvas.itemconfig(self.preview_image_id, image=photo)
+            self.preview_canvas.coords(self.preview_image_id, x, y)
+        self.preview_canvas.image = photo
+
+    def _on_preview_resize(self, event):
+        """Remember the preview canvas size for the preview thread"""
+        self.preview_size = (event.width, event.height)
 
     def capture_image(self):
         """Capture current frame"""
@@ -1048,8 +1254,7 @@ python3 main_enhanced.py"""
         self.progress_var.set(0)
 
         # Clear previous results
-        for item in self.results_tree.get_children():
-            self.results_tree.delete(item)
+        self.results_tree.delete(*self.results_tree.get_children())
 
         self.test_thread = threading.Thread(target=self._run_test_thread,
                                            args=(test_list,), daemon=True)
@@ -1063,13 +1268,11 @@ python3 main_enhanced.py"""
             if not self.is_testing:
                 break
 
-            # Update progress
+            # Update progress bar and label in a single UI callback
             progress = (i / total_tests) * 100
-            self.root.after(0, lambda p=progress: self.progress_var.set(p))
-
             test_name = self.get_test_name(test_key)
-            self.root.after(0, lambda n=test_name: self.progress_label.config(
-                text=f"Running: {n}"))
+            self.root.after(0, lambda p=progress, n=test_name: self._show_test_progress(
+                p, f"Running: {n}"))
 
             # Run test
             timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
@@ -1093,13 +1296,16 @@ python3 main_enhanced.py"""
             time.sleep(0.5)  # Brief pause between tests
 
         # Complete
-        self.root.after(0, lambda: self.progress_var.set(100))
-        self.root.after(0, lambda: self.progress_label.config(text="Testing Complete"))
-        self.root.after(0, lambda: self.update_status(
-            f"Completed {len(self.test_results)} tests"))
+        self.root.after(0, lambda: self._show_test_progress(100, "Testing Complete"))
+        self.update_status(f"Completed {len(self.test_results)} tests")
 
         self.is_testing = False
 
+    def _show_test_progress(self, progress, label):
+        """Update the progress bar and its label together"""
+        self.progress_var.set(progress)
+        self.progress_label.config(text=label)
+
     def execute_test(self, test_key, timestamp):
         """Execute individual test"""
         test_map = {
@@ -1152,18 +1358,10 @@ python3 main_enhanced.py"""
 
     def test_resolution(self, timestamp):
         """Test resolution capabilities"""
-        resolutions_to_test = [
-            (8000, 6000, "48MP"),
-            (4000, 3000, "12MP"),
-            (1920, 1080, "1080p"),
-            (1280, 720, "720p"),
-            (640, 480, "VGA")
-        ]
-
         results = {}
         supported = []
 
-        for width, height, name in resolutions_to_test:
+        for width, height, name in self.TEST_RESOLUTIONS:
             self.camera.set(cv2.CAP_PROP_FRAME_WIDTH, width)
             self.camera.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
 
@@ -1192,13 +1390,7 @@ python3 main_enhanced.py"""
         fps_results = {}
 
         # Test at different resolutions
-        test_configs = [
-            (1920, 1080, "1080p"),
-            (1280, 720, "720p"),
-            (640, 480, "VGA")
-        ]
-
-        for width, height, name in test_configs:
+        for width, height, name in self.FRAMERATE_RESOLUTIONS:
             self.camera.set(cv2.CAP_PROP_FRAME_WIDTH, width)
             self.camera.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
 
@@ -1302,9 +1494,10 @@ python3 main_enhanced.py"""
 
                 ret, frame = self.camera.read()
                 if ret:
-                    # Measure brightness
-                    gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-                    mean_brightness = np.mean(gray)
+                    # Measure brightness on every 4th pixel; the mean is
+                    # unaffected and 1/16 of the data is touched
+                    gray = frame[::4, ::4] @ _BGR2Y
+                    mean_brightness = float(np.mean(gray))
                     exposure_results["measured_values"].append(mean_brightness)
                     exposure_results["exposure_range"].append(exp_val)
 
@@ -1339,7 +1532,8 @@ python3 main_enhanced.py"""
         try:
             # Test auto white balance
             self.camera.set(cv2.CAP_PROP_AUTO_WB, 1)
-            ret, frame = self.camera.read()
+            # Skip the frame buffered before auto white balance was enabled
+            ret, frame = self.read_fresh_frame(flush=1)
 
             if ret:
                 wb_results["auto_wb"] = True
@@ -1393,7 +1587,7 @@ python3 main_enhanced.py"""
         }
 
         try:
-            ret, frame = self.camera.read()
+            ret, frame = self.read_fresh_frame()
             if ret:
                 gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
 
@@ -1448,17 +1642,25 @@ python3 main_enhanced.py"""
         }
 
         try:
-            # Capture multiple frames for noise analysis
-            frames = []
+            # Capture multiple frames for noise analysis (4x downsampled luma, paced by grab())
+            frame_stack = None
+            frame_count = 0
             for _ in range(5):
-                ret, frame = self.camera.read()
+                if not self.camera.grab():
+                    continue
+                ret, frame = self.camera.retrieve()
                 if ret:
-                    frames.append(cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY))
-                time.sleep(0.1)
+                    roi = frame[::4, ::4]
+                    if frame_stack is None:
+                        frame_stack = np.empty((5,) + roi.shape[:2], dtype=np.float32)
+                    elif roi.shape[:2] != frame_stack.shape[1:]:
+                        continue  # Resolution changed mid-capture
+                    np.matmul(roi, _BGR2Y, out=frame_stack[frame_count])
+                    frame_count += 1
 
-            if len(frames) >= 2:
+            if frame_count >= 2:
                 # Calculate noise as standard deviation between frames
-                frame_stack = np.array(frames)
+                frame_stack = frame_stack[:frame_count]
                 noise_std = np.std(frame_stack, axis=0)
                 noise_level = np.mean(noise_std)
                 noise_results["noise_level"] = float(noise_level)
@@ -1512,7 +1714,7 @@ python3 main_enhanced.py"""
         }
 
         try:
-            ret, frame = self.camera.read()
+            ret, frame = self.read_fresh_frame()
             if ret:
                 # Analyze color channels
                 b, g, r = cv2.split(frame)
@@ -1863,22 +2065,13 @@ python3 main_enhanced.py"""
 
     def add_result_to_tree(self, result):
         """Add test result to tree view"""
-        status_color = {
-            TestStatus.PASS: self.colors['accent_green'],
-            TestStatus.FAIL: self.colors['accent_red'],
-            TestStatus.PARTIAL: self.colors['accent_yellow'],
-            TestStatus.SKIP: self.colors['text_secondary'],
-            TestStatus.ERROR: self.colors['accent_purple']
-        }
-
         # Format time
         time_str = result.timestamp.split(' ')[1].split(':')
         time_short = f"{time_str[0]}:{time_str[1]}"
 
         # Format details
         if result.measurements:
-            key = list(result.measurements.keys())[0]
-            value = result.measurements[key]
+            value = next(iter(result.measurements.values()))
             if isinstance(value, float):
                 details = f"{value:.1f}"
             else:
@@ -1886,15 +2079,11 @@ python3 main_enhanced.py"""
         else:
             details = "-"
 
-        # Insert into tree
-        item = self.results_tree.insert('', 'end',
-                                       text=result.test_name,
-                                       values=(result.status.value, time_short, details))
-
-        # Color code based on status
-        self.results_tree.item(item, tags=(result.status.value,))
-        self.results_tree.tag_configure(result.status.value,
-                                       foreground=status_color[result.status])
+        # Insert into tree, color coded by its status tag
+        self.results_tree.insert('', 'end',
+                                 text=result.test_name,
+                                 values=(result.status.value, time_short, details),
+                                 tags=(result.status.value,))
 
         # Update test count
         self.test_count_label.config(text=f"Tests: {len(self.test_results)}")
@@ -1902,8 +2091,7 @@ python3 main_enhanced.py"""
     def clear_results(self):
         """Clear test results"""
         self.test_results = []
-        for item in self.results_tree.get_children():
-            self.results_tree.delete(item)
+        self.results_tree.delete(*self.results_tree.get_children())
         self.test_count_label.config(text="Tests: 0")
         self.update_status("Results cleared")
 
@@ -1934,7 +2122,11 @@ python3 main_enhanced.py"""
             self.update_status("PDF export requires additional libraries")
 
     def update_status(self, message, error=False):
-        """Update status message"""
+        """Update status message (safe to call from worker threads)"""
+        if threading.current_thread() is not threading.main_thread():
+            self.root.after(0, lambda: self.update_status(message, error))
+            return
+
         self.status_message.config(text=message)
         if error:
             self.status_message.config(fg=self.colors['accent_red'])
@@ -6,7 +6,6 @@ For WN-L2307k368 48MP BM Camera Module with Samsung S5KGM1ST Sensor
 """
 
 import sys
-import os
 import platform
 from datetime import datetime
 import time
@@ -14,9 +13,8 @@ import threading
 import json
 import cv2
 import numpy as np
-from dataclasses import dataclass, asdict, field
-from typing import Dict, List, Optional, Tuple, Any
-from enum import Enum
+
+from results import TestStatus, DetailedTestResult
 
 # Import v4l2 settings module
 try:
@@ -57,35 +55,6 @@ def check_camera_permissions():
     return True  # Assume permissions OK on other platforms
 
 
-class TestStatus(Enum):
-    PASS = "PASS"
-    FAIL = "FAIL"
-    PARTIAL = "PARTIAL"
-    SKIP = "SKIP"
-    ERROR = "ERROR"
-
-
-@dataclass
-class DetailedTestResult:
-    test_name: str
-    status: TestStatus
-    message: str
-    timestamp: str
-    details: Dict[str, Any] = field(default_factory=dict)
-    measurements: Dict[str, float] = field(default_factory=dict)
-    raw_data: Optional[np.ndarray] = None
-
-    def to_dict(self):
-        return {
-            'test_name': self.test_name,
-            'status': self.status.value,
-            'message': self.message,
-            'timestamp': self.timestamp,
-            'details': self.details,
-            'measurements': self.measurements
-        }
-
-
 class CameraThread(QThread):
     """Thread for camera operations to prevent UI blocking"""
     frame_ready = pyqtSignal(np.ndarray)
@@ -93,6 +62,9 @@ class CameraThread(QThread):
     camera_disconnected = pyqtSignal()
     error_occurred = pyqtSignal(str)
 
+    # Consecutive failed grabs before the preview gives up on the camera
+    MAX_GRAB_FAILURES = 50
+
     def __init__(self):
         super().__init__()
         self.camera = None
@@ -100,6 +72,12 @@ class CameraThread(QThread):
         self.camera_backend = cv2.CAP_ANY
         self.running = False
         self.capture_mode = False
+        self.prefer_mjpeg = True  # Disable to keep the driver default (e.g. YUY2)
+
+        # Newest frame from the capture loop, shared with the UI and tests
+        self._frame_lock = threading.Lock()
+        self._latest_frame = None
+        self._release_on_exit = False
 
     def connect_camera(self, index, backend=cv2.CAP_ANY):
         """Connect to camera in thread"""
@@ -112,6 +90,10 @@ class CameraThread(QThread):
             if self.camera.isOpened():
                 self.camera.set(cv2.CAP_PROP_BUFFERSIZE, 1)
 
+                # MJPEG keeps high resolutions within USB 2.0 bandwidth
+                if self.prefer_mjpeg:
+                    self.camera.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*'MJPG'))
+
                 # Give camera time to initialize
                 time.sleep(0.1)
 
@@ -143,32 +125,72 @@ class CameraThread(QThread):
     def disconnect_camera(self):
         """Disconnect camera"""
         self.running = False
-        if self.camera:
+        # Release only once the capture loop has stopped using the camera;
+        # if it is still blocked in grab() after the timeout, run()
+        # releases it on exit instead (release() is safe to repeat)
+        self._release_on_exit = True
+        if self.wait(1000) and self.camera:
             self.camera.release()
-            self.camera = None
+        self.camera = None
+        with self._frame_lock:
+            self._latest_frame = None
         self.camera_disconnected.emit()
 
     def start_preview(self):
         """Start camera preview"""
         self.running = True
+        self._release_on_exit = False
         self.start()
 
     def stop_preview(self):
         """Stop camera preview"""
         self.running = False
 
+    def get_latest_frame(self):
+        """Return the most recent frame captured by the preview loop"""
+        with self._frame_lock:
+            return self._latest_frame
+
     def run(self):
         """Main camera loop"""
-        while self.running and self.camera:
+        # grab() blocks until the camera delivers a frame, so the loop runs
+        # at the camera's rate and never falls behind the driver buffer;
+        # frames are only decoded and emitted at the display rate
+        emit_interval = 0.033  # ~30 FPS
+        last_emit = 0
+        failures = 0
+        camera = self.camera
+        while self.running and camera is not None:
             try:
-                ret, frame = self.camera.read()
+                if not camera.grab():
+                    # Back off instead of spinning on a stalled or unplugged camera
+                    failures += 1
+                    if failures >= self.MAX_GRAB_FAILURES:
+                        self.error_occurred.emit("Camera stopped delivering frames")
+                        self.running = False
+                        break
+                    time.sleep(0.05)
+                    continue
+                failures = 0
+
+                now = time.monotonic()
+                if now - last_emit < emit_interval:
+                    continue
+
+                ret, frame = camera.retrieve()
                 if ret and frame is not None:
+                    with self._frame_lock:
+                        self._latest_frame = frame
+                    last_emit = now
                     self.frame_ready.emit(frame)
-                time.sleep(0.033)  # ~30 FPS
             except Exception as e:
                 self.error_occurred.emit(f"Frame capture error: {str(e)}")
+                self.running = False
                 break
 
+        if self._release_on_exit and camera is not None:
+            camera.release()
+
 
 class TestWorker(QThread):
     """Worker thread for running tests"""
@@ -1065,10 +1087,13 @@ class ProfessionalCameraTestGUI(QMainWindow):
 
     def capture_image(self):
         """Capture current frame"""
-        if self.current_frame is not None:
+        frame = self.camera_thread.get_latest_frame()
+        if frame is None:
+            frame = self.current_frame
+        if frame is not None:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"capture_{timestamp}.jpg"
-            cv2.imwrite(filename, self.current_frame)
+            cv2.imwrite(filename, frame)
             self.status_bar.showMessage(f"Image saved: {filename}")
         else:
             QMessageBox.warning(self, "No Frame", "No frame to capture")
@@ -1147,6 +1172,10 @@ class ProfessionalCameraTestGUI(QMainWindow):
         """Update preview with new frame"""
         self.current_frame = frame
 
+        # Nothing to draw while the window is minimized or hidden
+        if self.isMinimized() or not self.isVisible():
+            return
+
         # Convert frame to QImage
         rgb_image = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
         h, w, ch = rgb_image.shape
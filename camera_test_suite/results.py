@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""
+Shared test result types for the USB Camera Test Suite
+Used by both the Tkinter (main.py) and PyQt6 (main_pyqt6.py) front ends
+"""
+
+import numpy as np
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Any
+from enum import Enum
+
+
+class TestStatus(Enum):
+    PASS = "PASS"
+    FAIL = "FAIL"
+    PARTIAL = "PARTIAL"
+    SKIP = "SKIP"
+    ERROR = "ERROR"
+
+
+@dataclass
+class DetailedTestResult:
+    test_name: str
+    status: TestStatus
+    message: str
+    timestamp: str
+    details: Dict[str, Any] = field(default_factory=dict)
+    measurements: Dict[str, float] = field(default_factory=dict)
+    raw_data: Optional[np.ndarray] = None
+
+    def to_dict(self):
+        return {
+            'test_name': self.test_name,
+            'status': self.status.value,
+            'message': self.message,
+            'timestamp': self.timestamp,
+            'details': self.details,
+            'measurements': self.measurements
+        }
@@ -11,6 +11,8 @@ INSTALLER_NAME="USB Camera Tester Installer"
 VERSION="4.0"
 BUILD_DIR="standalone_installer_build"
 BUNDLE_ID="com.usb-camera-tester.standalone-installer"
+DMG_NAME="🎥_USB_Camera_Tester_COMPLETE_INSTALLER_v$VERSION.dmg"
+BUILD_STAMP="$BUILD_DIR/.inputs.sha1"
 
 # Colors for output
 RED='\033[0;31m'
@@ -30,27 +32,63 @@ print_error() {
     echo -e "${RED}❌ $1${NC}"
 }
 
+# Copy a directory tree, cloning files on APFS instead of duplicating data
+copy_tree() {
+    cp -Rc "$1" "$2" 2>/dev/null || cp -R "$1" "$2"
+}
+
+# Copy a single file, cloning it on APFS when possible
+copy_file() {
+    cp -c "$1" "$2" 2>/dev/null || cp "$1" "$2"
+}
+
 echo "🚀 Creating Standalone USB Camera Tester Installer..."
 
+# Skip the build entirely when neither the test suite nor this script has
+# changed since the last DMG was produced (set FORCE_REBUILD=1 to override)
+INPUTS_HASH=$( {
+    find camera_test_suite -type f ! -path '*/__pycache__/*' ! -name '*.pyc' ! -name '.DS_Store' -print0 \
+        | sort -z | xargs -0 shasum
+    shasum < "$0"
+} | shasum | cut -d' ' -f1 )
+
+if [ -z "$FORCE_REBUILD" ] && [ -f "$BUILD_DIR/$DMG_NAME" ] && [ "$(cat "$BUILD_STAMP" 2>/dev/null)" = "$INPUTS_HASH" ]; then
+    print_success "Installer is up to date: $BUILD_DIR/$DMG_NAME"
+    exit 0
+fi
+
 # Clean up previous build
 print_status "Cleaning up previous build..."
 rm -rf "$BUILD_DIR"
 mkdir -p "$BUILD_DIR"
 
-# Create app bundle structure
-APP_BUNDLE="$BUILD_DIR/$INSTALLER_NAME.app"
+# Create app bundle structure directly in the DMG staging folder, so the
+# finished bundle does not have to be copied again before imaging
+DMG_TEMP="$BUILD_DIR/dmg_temp"
+APP_BUNDLE="$DMG_TEMP/$INSTALLER_NAME.app"
 CONTENTS_DIR="$APP_BUNDLE/Contents"
 MACOS_DIR="$CONTENTS_DIR/MacOS"
 RESOURCES_DIR="$CONTENTS_DIR/Resources"
 
-mkdir -p "$MACOS_DIR"
-mkdir -p "$RESOURCES_DIR"
+mkdir -p "$MACOS_DIR" "$RESOURCES_DIR"
 
 print_status "Creating application bundle structure..."
 
-# Copy the entire camera test suite
+# Copy the camera test suite, leaving out bytecode caches, Finder metadata and
+# the Linux/Raspberry Pi installers and guides that the macOS app never uses
 print_status "Packaging camera test suite..."
-cp -R camera_test_suite "$RESOURCES_DIR/"
+SUITE_EXCLUDES=(
+    --exclude '__pycache__' --exclude '*.pyc' --exclude '.DS_Store'
+    --exclude 'install_*.sh' --exclude 'pi_one_click_setup.sh'
+    --exclude 'launch_linux.sh' --exclude 'camera_diagnostics_linux.sh'
+    --exclude 'requirements_linux.txt' --exclude 'test_v4l2_linux.py'
+    --exclude '*LINUX.md' --exclude '*PI_*.md'
+)
+if command -v rsync >/dev/null 2>&1; then
+    rsync -a --whole-file "${SUITE_EXCLUDES[@]}" camera_test_suite "$RESOURCES_DIR/"
+else
+    copy_tree camera_test_suite "$RESOURCES_DIR/"
+fi
 
 # Create the launcher script in Resources
 print_status "Adding launcher script..."
@@ -70,18 +108,16 @@ APP_DIR="$APP_BUNDLE/Contents/Resources/camera_test_suite"
 
 echo "Looking for app in: $APP_DIR"
 
-# Check if app bundle exists
-if [ ! -d "$APP_BUNDLE" ]; then
-    echo "❌ USB Camera Tester app not found in Applications folder"
-    echo "Please make sure the app is installed correctly."
-    read -p "Press Enter to exit..."
-    exit 1
-fi
-
-# Check if camera test suite exists
+# Check the camera test suite; the bundle itself only needs checking to
+# explain a failure, since the suite cannot exist without it
 if [ ! -d "$APP_DIR" ]; then
-    echo "❌ Camera test suite not found in app bundle"
-    echo "App may be corrupted. Please reinstall."
+    if [ ! -d "$APP_BUNDLE" ]; then
+        echo "❌ USB Camera Tester app not found in Applications folder"
+        echo "Please make sure the app is installed correctly."
+    else
+        echo "❌ Camera test suite not found in app bundle"
+        echo "App may be corrupted. Please reinstall."
+    fi
     read -p "Press Enter to exit..."
     exit 1
 fi
@@ -90,14 +126,29 @@ fi
 cd "$APP_DIR"
 echo "✅ Found camera test suite"
 
-# Find Python
+# Dependencies only need checking until this interpreter has passed once
+DEPS_STAMP="$HOME/Library/Caches/USB Camera Tester/deps_verified"
+
+# Find Python, reusing the interpreter verified on an earlier run if it still exists
 PYTHON_CMD=""
-for python_path in /Library/Frameworks/Python.framework/Versions/3.13/bin/python3 /Library/Frameworks/Python.framework/Versions/*/bin/python3 /opt/homebrew/bin/python3 /usr/local/bin/python3 python3; do
-    if command -v "$python_path" &> /dev/null; then
-        PYTHON_CMD="$python_path"
-        break
+DEPS_VERIFIED=false
+if [ -f "$DEPS_STAMP" ]; then
+    read -r PYTHON_CMD < "$DEPS_STAMP"
+    if [ -n "$PYTHON_CMD" ] && command -v "$PYTHON_CMD" &> /dev/null; then
+        DEPS_VERIFIED=true
+    else
+        PYTHON_CMD=""
     fi
-done
+fi
+
+if [ -z "$PYTHON_CMD" ]; then
+    for python_path in /Library/Frameworks/Python.framework/Versions/3.13/bin/python3 /Library/Frameworks/Python.framework/Versions/*/bin/python3 /opt/homebrew/bin/python3 /usr/local/bin/python3 python3; do
+        if command -v "$python_path" &> /dev/null; then
+            PYTHON_CMD="$python_path"
+            break
+        fi
+    done
+fi
 
 if [ -z "$PYTHON_CMD" ]; then
     echo "❌ Python 3 not found. Please install Python from python.org"
@@ -112,50 +163,61 @@ export PYTHONNOUSERSITE=0
 # Ensure we're not in any conflicting directories
 echo "Current directory: $(pwd)"
 
-# Test imports before launching
-echo "Testing Python imports..."
-if ! "$PYTHON_CMD" -c "import sys; print('Python version:', sys.version)" 2>/dev/null; then
-    echo "❌ Python test failed"
-    read -p "Press Enter to exit..."
-    exit 1
-fi
-
-if ! "$PYTHON_CMD" -c "import numpy; print('✅ numpy version:', numpy.__version__)" 2>/dev/null; then
-    echo "❌ numpy import failed - auto-installing correct version..."
-    echo "Installing numpy<2 (required for opencv)..."
-    "$PYTHON_CMD" -m pip install --user --force-reinstall "numpy<2" >/dev/null 2>&1
-    if ! "$PYTHON_CMD" -c "import numpy; print('✅ numpy version:', numpy.__version__)" 2>/dev/null; then
-        echo "❌ numpy still failing. Please run: pip3 install --user 'numpy<2'"
-        read -p "Press Enter to exit..."
-        exit 1
+if [ "$DEPS_VERIFIED" = true ]; then
+    echo "✅ Python modules already verified for $PYTHON_CMD"
+else
+    # Test imports before launching
+    echo "Testing Python imports..."
+
+    # Collect every failing module so they can be repaired by one pip run
+    # (the numpy probe also reports the interpreter version)
+    MISSING_SPECS=()
+    FAILED_IMPORTS=()
+    if ! "$PYTHON_CMD" -c "import sys; print('Python version:', sys.version); import numpy; print('✅ numpy version:', numpy.__version__)" 2>/dev/null; then
+        echo "❌ numpy import failed - will install numpy<2 (required for opencv)"
+        MISSING_SPECS+=("numpy<2")
+        FAILED_IMPORTS+=("numpy")
     fi
-fi
 
-if ! "$PYTHON_CMD" -c "import cv2; print('✅ opencv version:', cv2.__version__)" 2>/dev/null; then
-    echo "❌ opencv import failed - auto-installing..."
-    "$PYTHON_CMD" -m pip install --user --force-reinstall opencv-python >/dev/null 2>&1
     if ! "$PYTHON_CMD" -c "import cv2; print('✅ opencv version:', cv2.__version__)" 2>/dev/null; then
-        echo "❌ opencv still failing. Please run: pip3 install --user opencv-python"
-        read -p "Press Enter to exit..."
-        exit 1
+        echo "❌ opencv import failed - will install opencv-python"
+        MISSING_SPECS+=("opencv-python")
+        FAILED_IMPORTS+=("cv2")
     fi
-fi
 
-if ! "$PYTHON_CMD" -c "import PyQt6; print('✅ PyQt6 imported successfully')" 2>/dev/null; then
-    echo "❌ PyQt6 import failed - auto-installing..."
-    "$PYTHON_CMD" -m pip install --user PyQt6 >/dev/null 2>&1
     if ! "$PYTHON_CMD" -c "import PyQt6; print('✅ PyQt6 imported successfully')" 2>/dev/null; then
-        echo "❌ PyQt6 still failing. Please run: pip3 install --user PyQt6"
-        read -p "Press Enter to exit..."
-        exit 1
+        echo "❌ PyQt6 import failed - will install PyQt6"
+        MISSING_SPECS+=("PyQt6")
+        FAILED_IMPORTS+=("PyQt6")
     fi
-fi
 
-echo "✅ All imports successful"
+    if [ ${#MISSING_SPECS[@]} -gt 0 ]; then
+        echo "Auto-installing ${MISSING_SPECS[*]}..."
+        "$PYTHON_CMD" -m pip install -q --user --prefer-binary --force-reinstall \
+            --disable-pip-version-check --no-warn-script-location "${MISSING_SPECS[@]}" >/dev/null 2>&1
+
+        for module in "${FAILED_IMPORTS[@]}"; do
+            if ! "$PYTHON_CMD" -c "import $module; print('✅ $module imported successfully')" 2>/dev/null; then
+                case $module in
+                    "numpy") echo "❌ numpy still failing. Please run: pip3 install --user 'numpy<2'" ;;
+                    "cv2") echo "❌ opencv still failing. Please run: pip3 install --user opencv-python" ;;
+                    *) echo "❌ $module still failing. Please run: pip3 install --user $module" ;;
+                esac
+                read -p "Press Enter to exit..."
+                exit 1
+            fi
+        done
+    fi
+
+    echo "✅ All imports successful"
+    mkdir -p "${DEPS_STAMP%/*}"
+    echo "$PYTHON_CMD" > "$DEPS_STAMP"
+fi
 
 # Run the app normally (no env -i which breaks Python paths)
+# A failed run forces a full dependency check on the next launch
 echo "Starting USB Camera Tester..."
-"$PYTHON_CMD" main_pyqt6.py
+"$PYTHON_CMD" main_pyqt6.py || rm -f "$DEPS_STAMP"
 
 echo ""
 echo "App closed."
@@ -190,6 +252,27 @@ if [ ! -d "$RESOURCES_DIR" ]; then
     exit 1
 fi
 
+# Copy a directory tree, cloning files on APFS instead of duplicating data
+copy_tree() {
+    cp -Rc "$1" "$2" 2>/dev/null || cp -R "$1" "$2"
+}
+
+# Copy a single file, cloning it on APFS when possible
+copy_file() {
+    cp -c "$1" "$2" 2>/dev/null || cp "$1" "$2"
+}
+
+# Run a pip install, streaming its output as it arrives instead of hiding it.
+# Progress bars, PATH warnings for --user scripts and pip's self-update check
+# only add noise (and an index round-trip) to that output
+PIP_QUIET_FLAGS="--disable-pip-version-check --no-warn-script-location --progress-bar off"
+run_pip() {
+    eval "$PIP_CMD $1 $PIP_QUIET_FLAGS" 2>&1 | while IFS= read -r line; do
+        echo "    $line"
+    done
+    return ${PIPESTATUS[0]}
+}
+
 echo "🎥 USB Camera Tester Standalone Installer"
 echo "========================================"
 echo ""
@@ -221,20 +304,35 @@ fi
 
 # Check and install required modules
 echo "Checking Python modules..."
+
+# Import name, pip package and pinned requirement of each required module,
+# kept index-aligned so no per-module name mapping is needed later
+REQUIRED_IMPORTS=(cv2 numpy PyQt6)
+REQUIRED_PACKAGES=(opencv-python numpy PyQt6)
+REQUIRED_SPECS=("opencv-python" "numpy<2" "PyQt6>=6.4.0,<6.8.0")
+
 MODULES_NEEDED=()
+IMPORTS_NEEDED=()
+PIP_SPECS=()
 
 # Check each required module with better error handling
+# The imports are independent, so run all probes at once and collect results
 echo "Testing module imports..."
-for module in cv2 numpy PyQt6; do
-    echo -n "  Checking $module... "
-    if "$PYTHON_CMD" -c "import $module; print('OK')" 2>/dev/null | grep -q "OK"; then
+PROBE_PIDS=()
+for module in "${REQUIRED_IMPORTS[@]}"; do
+    "$PYTHON_CMD" -c "import $module" >/dev/null 2>&1 &
+    PROBE_PIDS+=($!)
+done
+
+for probe in "${!REQUIRED_IMPORTS[@]}"; do
+    echo -n "  Checking ${REQUIRED_IMPORTS[$probe]}... "
+    if wait "${PROBE_PIDS[$probe]}"; then
         echo "✅ installed"
     else
         echo "❌ missing"
-        case $module in
-            "cv2") MODULES_NEEDED+=("opencv-python") ;;
-            *) MODULES_NEEDED+=("$module") ;;
-        esac
+        MODULES_NEEDED+=("${REQUIRED_PACKAGES[$probe]}")
+        IMPORTS_NEEDED+=("${REQUIRED_IMPORTS[$probe]}")
+        PIP_SPECS+=("${REQUIRED_SPECS[$probe]}")
     fi
 done
 
@@ -282,23 +380,48 @@ if [ ${#MODULES_NEEDED[@]} -gt 0 ]; then
 
     echo "Installing modules with: $PIP_CMD"
 
+    # Keep downloaded wheels between installer runs so reinstalls skip the network
+    export PIP_CACHE_DIR="$HOME/Library/Caches/USB Camera Tester/pip"
+    mkdir -p "$PIP_CACHE_DIR"
+
     # Detect architecture for proper package installation
     ARCH=$(uname -m)
     echo "Detected architecture: $ARCH"
 
-    # Install each module with architecture-specific fixes
+    # Resolve all missing modules in a single pip run first
+    # Wheels only: never fall into a source build on the fast path
+    PIP_FAST_FLAGS="--only-binary=:all:"
+
+    echo "Installing ${PIP_SPECS[*]} in a single pip run..."
+    if run_pip "install --user $PIP_FAST_FLAGS $(printf "'%s' " "${PIP_SPECS[@]}")"; then
+        # Only modules that still fail to import need the per-module fixes below
+        RETRY_MODULES=()
+        for needed in "${!MODULES_NEEDED[@]}"; do
+            module="${MODULES_NEEDED[$needed]}"
+            if "$PYTHON_CMD" -c "import ${IMPORTS_NEEDED[$needed]}" >/dev/null 2>&1; then
+                echo "✅ $module installed successfully"
+            else
+                RETRY_MODULES+=("$module")
+            fi
+        done
+        MODULES_NEEDED=("${RETRY_MODULES[@]}")
+    else
+        echo "⚠️  Batch installation failed, installing modules one by one..."
+    fi
+
+    # Install each remaining module with architecture-specific fixes
     for module in "${MODULES_NEEDED[@]}"; do
         echo "Installing $module for $ARCH architecture..."
 
         if [ "$module" = "numpy" ]; then
             # CRITICAL: Install numpy<2 for opencv compatibility
             echo "  Installing numpy<2 (required for opencv compatibility)..."
-            if eval "$PIP_CMD install --user --force-reinstall --no-cache-dir 'numpy<2'" >/dev/null 2>&1; then
+            if run_pip "install --user --prefer-binary --force-reinstall 'numpy<2'"; then
                 echo "✅ numpy installed successfully (version <2 for opencv)"
             else
                 echo "❌ numpy installation failed - trying alternative approach..."
                 eval "$PIP_CMD uninstall -y numpy" >/dev/null 2>&1
-                if eval "$PIP_CMD install --user --no-cache-dir 'numpy==1.26.4'" >/dev/null 2>&1; then
+                if run_pip "install --user --prefer-binary 'numpy==1.26.4'"; then
                     echo "✅ numpy 1.26.4 installed successfully"
                 else
                     echo "⚠️  numpy installation may have issues, but continuing..."
@@ -311,19 +434,19 @@ if [ ${#MODULES_NEEDED[@]} -gt 0 ]; then
 
             # Install opencv - let pip find the best compatible version
             echo "  Installing opencv-python (will auto-select compatible version)..."
-            if eval "$PIP_CMD install --user --force-reinstall --no-cache-dir opencv-python" >/dev/null 2>&1; then
+            if run_pip "install --user --prefer-binary --force-reinstall opencv-python"; then
                 echo "✅ opencv-python installed successfully"
             else
                 echo "⚠️  opencv-python installation failed, trying specific version..."
                 if [ "$ARCH" = "arm64" ]; then
                     # Try specific ARM64 compatible version
-                    if eval "$PIP_CMD install --user --force-reinstall --no-cache-dir 'opencv-python==4.11.0.86'" >/dev/null 2>&1; then
+                    if run_pip "install --user --prefer-binary --force-reinstall 'opencv-python==4.11.0.86'"; then
                         echo "✅ opencv-python 4.11.0.86 installed (ARM64)"
                     else
                         echo "❌ opencv-python installation failed"
                     fi
                 else
-                    if eval "$PIP_CMD install --user --force-reinstall --no-cache-dir 'opencv-python==4.11.0.86'" >/dev/null 2>&1; then
+                    if run_pip "install --user --prefer-binary --force-reinstall 'opencv-python==4.11.0.86'"; then
                         echo "✅ opencv-python 4.11.0.86 installed (x86_64)"
                     else
                         echo "❌ opencv-python installation failed"
@@ -332,14 +455,14 @@ if [ ${#MODULES_NEEDED[@]} -gt 0 ]; then
             fi
         elif [ "$module" = "PyQt6" ]; then
             # Install specific PyQt6 version for compatibility
-            if eval "$PIP_CMD install --user --no-cache-dir 'PyQt6>=6.4.0,<6.8.0'" >/dev/null 2>&1; then
+            if run_pip "install --user --prefer-binary 'PyQt6>=6.4.0,<6.8.0'"; then
                 echo "✅ $module installed successfully (compatible version)"
             else
                 echo "⚠️  $module installation may have issues, but continuing..."
             fi
         else
             # Standard installation for other modules
-            if eval "$PIP_CMD install --user --no-cache-dir '$module'" >/dev/null 2>&1; then
+            if run_pip "install --user --prefer-binary '$module'"; then
                 echo "✅ $module installed successfully"
             else
                 echo "⚠️  $module installation may have issues, but continuing..."
@@ -354,15 +477,12 @@ if [ ${#MODULES_NEEDED[@]} -gt 0 ]; then
     # Verify installation with detailed version info
     echo "Verifying installation with version details..."
     echo "Python path: $PYTHON_CMD"
-    echo "Python version: $("$PYTHON_CMD" --version)"
     echo ""
 
     ALL_GOOD=true
 
-    # Check numpy with version
-    if "$PYTHON_CMD" -c "import numpy; print('✅ numpy version:', numpy.__version__)" 2>/dev/null; then
-        # Also verify numpy is compatible with opencv
-        NUMPY_VERSION=$("$PYTHON_CMD" -c "import numpy; print(numpy.__version__)" 2>/dev/null)
+    # Check numpy with version (reports the Python version from the same run)
+    if "$PYTHON_CMD" -c "import sys, numpy; print('Python version:', sys.version.split()[0]); print('✅ numpy version:', numpy.__version__)" 2>/dev/null; then
         echo "  ✅ numpy verified and compatible"
     else
         echo "  ❌ numpy still not working"
@@ -398,42 +518,62 @@ else
     echo "🚀 Proceeding directly to installation..."
 fi
 
+# Record the verified interpreter so the launcher can skip its import checks
+DEPS_STAMP="$HOME/Library/Caches/USB Camera Tester/deps_verified"
+mkdir -p "${DEPS_STAMP%/*}"
+echo "$PYTHON_CMD" > "$DEPS_STAMP"
+
 # Create Applications directory structure
 echo ""
 echo "Installing to Applications..."
 
 APP_DIR="/Applications/USB Camera Tester.app"
-APP_CONTENTS="$APP_DIR/Contents"
+# Assemble the bundle next to its final location and rename it into place
+# when complete; the rename stays on the same volume, so nothing is copied twice
+APP_STAGING="/Applications/.USB Camera Tester.app.installing"
+APP_CONTENTS="$APP_STAGING/Contents"
 APP_RESOURCES="$APP_CONTENTS/Resources"
 APP_MACOS="$APP_CONTENTS/MacOS"
-
-# Remove existing installation
-if [ -d "$APP_DIR" ]; then
-    echo "Removing existing installation..."
-    rm -rf "$APP_DIR"
+LAUNCHER_SRC="$RESOURCES_DIR/Launch USB Camera Tester.command"
+DESKTOP_LAUNCHER="$HOME/Desktop/🎥 Launch USB Camera Tester.command"
+APPS_LAUNCHER="/Applications/🎥 Launch USB Camera Tester.command"
+# Further copies are taken from the installed launcher, which already lives on
+# the destination volume and can be cloned instead of read back from the DMG
+APP_LAUNCHER="$APP_RESOURCES/Launch USB Camera Tester.command"
+
+# The bundle is assembled in place, so /Applications itself must be writable
+if [ ! -w "/Applications" ]; then
+    echo "❌ Cannot write to /Applications"
+    osascript -e 'display dialog "The installer cannot write to the Applications folder.\n\nPlease run it from an administrator account." buttons {"OK"} default button "OK" with icon stop'
+    exit 1
 fi
 
-# Create new installation
-mkdir -p "$APP_MACOS"
-mkdir -p "$APP_RESOURCES"
+# Create new installation. The staging bundle is removed on any exit,
+# including Ctrl-C or closing the Terminal window, so an interrupted run
+# never leaves a half-built app behind; after a successful rename there
+# is nothing left to remove
+trap 'rm -rf "$APP_STAGING"' EXIT
+trap 'exit 1' INT TERM HUP
+rm -rf "$APP_STAGING"
+mkdir -p "$APP_MACOS" "$APP_RESOURCES"
 
 # Copy camera test suite
 echo "Installing camera test suite..."
-cp -R "$RESOURCES_DIR/camera_test_suite" "$APP_RESOURCES/"
+copy_tree "$RESOURCES_DIR/camera_test_suite" "$APP_RESOURCES/"
 
 # Copy launcher to app resources
 echo "Installing launcher..."
-cp "$RESOURCES_DIR/Launch USB Camera Tester.command" "$APP_RESOURCES/"
+copy_file "$LAUNCHER_SRC" "$APP_RESOURCES/"
 
 # Also copy launcher to Desktop for easy access
 echo "Adding launcher to Desktop..."
-cp "$RESOURCES_DIR/Launch USB Camera Tester.command" "$HOME/Desktop/🎥 Launch USB Camera Tester.command"
-chmod +x "$HOME/Desktop/🎥 Launch USB Camera Tester.command"
+copy_file "$APP_LAUNCHER" "$DESKTOP_LAUNCHER"
+chmod +x "$DESKTOP_LAUNCHER"
 
 # And copy to Applications folder root for easy finding
 echo "Adding launcher to Applications folder..."
-cp "$RESOURCES_DIR/Launch USB Camera Tester.command" "/Applications/🎥 Launch USB Camera Tester.command"
-chmod +x "/Applications/🎥 Launch USB Camera Tester.command"
+copy_file "$APP_LAUNCHER" "$APPS_LAUNCHER"
+chmod +x "$APPS_LAUNCHER"
 
 # Create app launcher script
 cat > "$APP_MACOS/USBCameraTester" << 'APPLAUNCHER'
@@ -467,8 +607,8 @@ fi
 # Change to the application directory
 cd "$RESOURCES_DIR/camera_test_suite"
 
-# Launch the application
-"$PYTHON_CMD" main_pyqt6.py "$@"
+# Launch the application, replacing this shell instead of waiting on it
+exec "$PYTHON_CMD" main_pyqt6.py "$@"
 APPLAUNCHER
 
 chmod +x "$APP_MACOS/USBCameraTester"
@@ -508,17 +648,29 @@ cat > "$APP_CONTENTS/Info.plist" << 'INFOPLIST'
 INFOPLIST
 
 # Copy icon if it exists
-if [ -f "$RESOURCES_DIR/camera_test_suite/icons/app_icon.icns" ]; then
-    cp "$RESOURCES_DIR/camera_test_suite/icons/app_icon.icns" "$APP_RESOURCES/"
+if [ -f "$APP_RESOURCES/camera_test_suite/icons/app_icon.icns" ]; then
+    copy_file "$APP_RESOURCES/camera_test_suite/icons/app_icon.icns" "$APP_RESOURCES/"
 fi
 
 # Set permissions
-chmod -R 755 "$APP_DIR"
-chmod +x "$APP_MACOS/USBCameraTester"
-chmod +x "$APP_RESOURCES/Launch USB Camera Tester.command"
+chmod -R 755 "$APP_STAGING"
 
 # Remove quarantine
-xattr -cr "$APP_DIR" 2>/dev/null || true
+xattr -cr "$APP_STAGING" 2>/dev/null || true
+
+# Swap the finished bundle into place. The old install is renamed aside
+# first, so the app is only absent between two renames, and the old tree
+# is deleted in the background
+if [ -d "$APP_DIR" ]; then
+    echo "Replacing existing installation..."
+    APP_OLD="/Applications/.USB Camera Tester.app.old"
+    rm -rf "$APP_OLD"
+    mv "$APP_DIR" "$APP_OLD"
+    mv "$APP_STAGING" "$APP_DIR"
+    rm -rf "$APP_OLD" &
+else
+    mv "$APP_STAGING" "$APP_DIR"
+fi
 
 echo ""
 echo "✅ Installation complete!"
@@ -547,7 +699,7 @@ osascript -e 'display dialog "🎉 INSTALLATION SUCCESSFUL!\n\n✅ USB Camera Te
 if grep -q "Launch Camera Tester" /tmp/user_choice.txt 2>/dev/null; then
     echo "Launching USB Camera Tester..."
     # Launch using the desktop launcher for best permissions
-    open "$HOME/Desktop/🎥 Launch USB Camera Tester.command"
+    open "$DESKTOP_LAUNCHER"
 fi
 
 rm -f /tmp/user_choice.txt 2>/dev/null || true
@@ -557,6 +709,14 @@ chmod +x "$MACOS_DIR/$INSTALLER_NAME"
 
 # Create Info.plist for installer
 print_status "Creating Info.plist..."
+# Decide on the icon entry up front so the plist is written exactly once
+ICON_SRC="camera_test_suite/icons/app_icon.icns"
+ICON_KEYS=""
+if [ -f "$ICON_SRC" ]; then
+    ICON_KEYS="<key>CFBundleIconFile</key>
+    <string>app_icon</string>"
+fi
+
 cat > "$CONTENTS_DIR/Info.plist" << EOF
 <?xml version="1.0" encoding="UTF-8"?>
 <!DOCTYPE plist PUBLIC "-//Apple//DTD PLIST 1.0//EN" "http://www.apple.com/DTDs/PropertyList-1.0.dtd">
@@ -582,20 +742,20 @@ cat > "$CONTENTS_DIR/Info.plist" << EOF
     <true/>
     <key>LSApplicationCategoryType</key>
     <string>public.app-category.utilities</string>
+    $ICON_KEYS
 </dict>
 </plist>
 EOF
 
 # Add icon if available
-if [ -f "camera_test_suite/icons/app_icon.icns" ]; then
-    cp "camera_test_suite/icons/app_icon.icns" "$RESOURCES_DIR/"
+if [ -n "$ICON_KEYS" ]; then
+    copy_file "$ICON_SRC" "$RESOURCES_DIR/"
     print_success "Professional icon added"
 fi
 
 # Set permissions
 print_status "Setting bundle permissions..."
 chmod -R 755 "$APP_BUNDLE"
-chmod +x "$MACOS_DIR/$INSTALLER_NAME"
 
 # Remove quarantine
 print_status "Setting extended attributes..."
@@ -603,11 +763,6 @@ xattr -cr "$APP_BUNDLE" 2>/dev/null || true
 
 # Create a DMG for easy distribution
 print_status "Creating disk image..."
-DMG_NAME="🎥_USB_Camera_Tester_COMPLETE_INSTALLER_v$VERSION.dmg"
-DMG_TEMP="$BUILD_DIR/dmg_temp"
-
-mkdir -p "$DMG_TEMP"
-cp -R "$APP_BUNDLE" "$DMG_TEMP/"
 
 # Create instructions
 cat > "$DMG_TEMP/📋 README - EASY INSTALLATION.txt" << 'EOF'
@@ -658,6 +813,7 @@ EOF
 
 # Create DMG
 hdiutil create -srcfolder "$DMG_TEMP" -volname "USB Camera Tester Installer" -ov "$BUILD_DIR/$DMG_NAME"
+echo "$INPUTS_HASH" > "$BUILD_STAMP"
 
 print_success "Build complete!"
 echo ""
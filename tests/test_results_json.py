@@ -0,0 +1,40 @@
+"""
+Check that test results survive the JSON export path
+"""
+
+import json
+import os
+import sys
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("cv2")
+pytest.importorskip("tkinter")
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "camera_test_suite"))
+
+from main import ModernCameraHardwareTester
+
+
+class FakeCamera:
+    """Camera stub that returns a flat grey frame"""
+
+    def set(self, prop, value):
+        return True
+
+    def read(self):
+        return True, np.full((64, 64, 3), 100, dtype=np.uint8)
+
+
+class FakeTester:
+    camera = FakeCamera()
+
+
+def test_exposure_result_is_json_serializable(monkeypatch):
+    monkeypatch.setattr("main.time.sleep", lambda _: None)
+    result = ModernCameraHardwareTester.test_exposure(FakeTester(), "2024-01-01 00:00:00")
+
+    data = json.loads(json.dumps(result.to_dict()))
+    assert data["status"] == "PASS"
+    assert data["details"]["measured_values"] == pytest.approx([100.0] * 5)